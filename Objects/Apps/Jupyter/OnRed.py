@@ -1,5 +1,6 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 import re
+import time
 
 import os
 from PyQt5.QtWidgets import (
@@ -17,17 +18,44 @@ from PyQt5.QtWidgets import (
     QToolButton,
     QComboBox,
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QProcess, QTimer
 import subprocess
 import shlex
 
 
+# Matches e.g. "python/3.11.4 (D)"; flags must sit on the same line as the name
+_PYMOD_RE = re.compile(r"(python[^\s()]+)[ \t]*(?:\(([^)\n]+)\))?")
+
+# Parsed `module av` results shared across plugin windows: command -> (timestamp, modules, default)
+_MODULE_CACHE: Dict[str, Tuple[float, List[str], Optional[str]]] = {}
+_MODULE_CACHE_TTL_SECONDS = 300.0
+_MODULE_AV_COMMAND = "module av python 2>&1"
+
+
+def _preferred_python_module(modules: List[str], default_module: Optional[str]) -> str:
+    """Pick the module preselected in the combo.
+
+    A module named exactly "python" wins, then the site default (D), then the
+    first one listed; bare "python" is also the fallback when none were found.
+    """
+    if "python" in modules:
+        return "python"
+    if default_module and default_module in modules:
+        return default_module
+    if modules:
+        return modules[0]
+    return "python"
+
+
 def create_window(parent, context: Dict[str, Any]):
     """Factory function expected by the launcher.
 
     Must return a QMainWindow or QDialog (or any QWidget with .show()).
     The plugin MUST NOT create its own QApplication.
     """
+    # Resolved once; expanduser may hit NSS (LDAP/SSSD) when HOME is unset
+    _home = os.path.expanduser("~")
+
     window = QMainWindow(parent)
     window.setWindowTitle("Jupyter OnRed")
 
@@ -38,11 +66,11 @@ def create_window(parent, context: Dict[str, Any]):
     startup_dir_layout = QHBoxLayout()
     startup_dir_label = QLabel("Startup Directory:", central)
     startup_dir_edit = QLineEdit(central)
-    startup_dir_edit.setText(os.path.expanduser("~"))
+    startup_dir_edit.setText(_home)
     startup_dir_button = QPushButton("Browse…", central)
 
     def on_browse_startup_dir() -> None:
-        current_path = startup_dir_edit.text() or os.path.expanduser("~")
+        current_path = startup_dir_edit.text() or _home
         chosen = QFileDialog.getExistingDirectory(
             window,
             "Select Startup Directory",
@@ -83,75 +111,152 @@ def create_window(parent, context: Dict[str, Any]):
     advanced_toggle.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
     advanced_toggle.setArrowType(Qt.RightArrow)
 
-    advanced_content = QWidget(central)
-    advanced_content_layout = QVBoxLayout(advanced_content)
-    dont_record_checkbox = QCheckBox("Don't record history", advanced_content)
-    dont_record_checkbox.setChecked(False)
-    advanced_content_layout.addWidget(dont_record_checkbox)
-
-    # Python module selection combobox
-    module_row = QHBoxLayout()
-    module_label = QLabel("Python module:", advanced_content)
-    python_module_combo = QComboBox(advanced_content)
-    python_module_combo.setEditable(False)
-    module_row.addWidget(module_label)
-    module_row.addWidget(python_module_combo)
-    advanced_content_layout.addLayout(module_row)
+    # Only the Advanced widgets are built on first expand; the module query below
+    # starts with the window so Launch can use the detected default without them
+    advanced_content: Optional[QWidget] = None
+    dont_record_checkbox: Optional[QCheckBox] = None
+    python_module_combo: Optional[QComboBox] = None
+    refresh_modules_button: Optional[QPushButton] = None
+    # (modules, default module) from the latest query; None while it is still running
+    detected_python_modules: Optional[Tuple[List[str], Optional[str]]] = None
+
+    def _build_advanced_content() -> None:
+        nonlocal advanced_content, dont_record_checkbox, python_module_combo, refresh_modules_button
+        advanced_content = QWidget(central)
+        advanced_content_layout = QVBoxLayout(advanced_content)
+        dont_record_checkbox = QCheckBox("Don't record history", advanced_content)
+        dont_record_checkbox.setChecked(False)
+        advanced_content_layout.addWidget(dont_record_checkbox)
+
+        # Python module selection combobox
+        module_row = QHBoxLayout()
+        module_label = QLabel("Python module:", advanced_content)
+        python_module_combo = QComboBox(advanced_content)
+        python_module_combo.setEditable(False)
+        module_row.addWidget(module_label)
+        module_row.addWidget(python_module_combo)
+        refresh_modules_button = QPushButton("Refresh", advanced_content)
+        module_row.addWidget(refresh_modules_button)
+        advanced_content_layout.addLayout(module_row)
+
+        root_layout.insertWidget(root_layout.indexOf(advanced_toggle) + 1, advanced_content)
+        if detected_python_modules is None:
+            _show_python_modules_loading()
+        else:
+            _fill_python_modules_combo(*detected_python_modules)
+        refresh_modules_button.clicked.connect(lambda: _query_python_modules(force_refresh=True))
 
     def _parse_available_python_modules(raw_text: str):
-        modules = []
-        default_module = None
-        for line in raw_text.splitlines():
-            for m in re.finditer(r"(python[^\s()]+)\s*(?:\(([^)]+)\))?", line):
-                name = m.group(1)
-                flags_raw = m.group(2) or ""
-                flags_upper = flags_raw.upper()
-                if name not in modules:
-                    modules.append(name)
-                if default_module is None:
-                    if flags_upper == "D" or "DEFAULT" in flags_upper:
-                        default_module = name
-        return modules, default_module
-
-    def _populate_python_modules_combo() -> None:
-        try:
-            # Use login shell so that 'module' is available; capture stderr as well
-            result = subprocess.run(
-                ["bash", "-lc", "module av python 2>&1"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            output = (result.stdout or "") + (result.stderr or "")
-            modules, default_module = _parse_available_python_modules(output)
-        except Exception:
-            modules, default_module = [], None
-
+        """Yield (module_name, is_default) for each python module listed in raw_text."""
+        for m in _PYMOD_RE.finditer(raw_text):
+            flags_upper = (m.group(2) or "").upper()
+            yield m.group(1), flags_upper == "D" or "DEFAULT" in flags_upper
+
+    def _show_python_modules_loading() -> None:
+        # Placeholder entry until the module query output arrives
+        python_module_combo.clear()
+        python_module_combo.addItem("Loading…", None)
+        python_module_combo.setEnabled(False)
+        refresh_modules_button.setEnabled(False)
+
+    def _fill_python_modules_combo(modules, default_module) -> None:
+        python_module_combo.clear()
         if modules:
             for name in modules:
                 display = f"{name} (default)" if default_module and name == default_module else name
                 python_module_combo.addItem(display, name)
-            if "python" in modules:
-                idx = python_module_combo.findData("python")
-                python_module_combo.setCurrentIndex(idx if idx >= 0 else 0)
-            elif default_module and default_module in modules:
-                idx = python_module_combo.findData(default_module)
-                python_module_combo.setCurrentIndex(idx if idx >= 0 else 0)
-            else:
-                python_module_combo.setCurrentIndex(0)
+            idx = python_module_combo.findData(_preferred_python_module(modules, default_module))
+            python_module_combo.setCurrentIndex(idx if idx >= 0 else 0)
         else:
             # Fallback if nothing detected
             python_module_combo.addItem("python", "python")
             python_module_combo.setCurrentIndex(0)
+        python_module_combo.setEnabled(True)
+        refresh_modules_button.setEnabled(True)
+
+    def _set_detected_python_modules(modules: List[str], default_module: Optional[str]) -> None:
+        nonlocal detected_python_modules
+        detected_python_modules = (modules, default_module)
+        if python_module_combo is not None:
+            _fill_python_modules_combo(modules, default_module)
+
+    def _query_python_modules(force_refresh: bool = False) -> None:
+        nonlocal detected_python_modules
+        # The module list rarely changes within a session; reuse a recent result
+        cached = None if force_refresh else _MODULE_CACHE.get(_MODULE_AV_COMMAND)
+        if cached is not None and time.monotonic() - cached[0] < _MODULE_CACHE_TTL_SECONDS:
+            _set_detected_python_modules(cached[1], cached[2])
+            return
+
+        # A login shell can take seconds on HPC nodes, so query modules in the background
+        detected_python_modules = None
+        if python_module_combo is not None:
+            _show_python_modules_loading()
+
+        # Parse output line by line as it arrives rather than buffering it all
+        # (a dict keeps first-seen order while dropping duplicates)
+        found: Dict[str, None] = {}
+        default_module: Optional[str] = None
+        pending = b""
+
+        def consume(text: str) -> None:
+            nonlocal default_module
+            for name, is_default in _parse_available_python_modules(text):
+                found.setdefault(name)
+                if default_module is None and is_default:
+                    default_module = name
+
+        proc = QProcess(window)
+        proc.setProcessChannelMode(QProcess.MergedChannels)
+
+        def on_ready_read() -> None:
+            nonlocal pending
+            try:
+                pending += bytes(proc.readAllStandardOutput())
+                # Only complete lines; a partial one may split a name or a UTF-8 sequence
+                cut = pending.rfind(b"\n") + 1
+                if cut:
+                    consume(pending[:cut].decode("utf-8", errors="replace"))
+                    pending = pending[cut:]
+            except Exception:
+                pass
 
-    _populate_python_modules_combo()
-    advanced_content.setVisible(False)
+        def on_finished(exit_code: int, exit_status) -> None:
+            nonlocal pending
+            try:
+                pending += bytes(proc.readAllStandardOutput())
+                consume(pending.decode("utf-8", errors="replace"))
+                pending = b""
+            except Exception:
+                pass
+            modules = list(found)
+            if modules:
+                _MODULE_CACHE[_MODULE_AV_COMMAND] = (time.monotonic(), modules, default_module)
+            _set_detected_python_modules(modules, default_module)
+            proc.deleteLater()
+
+        def on_error(error) -> None:
+            # 'finished' is not emitted when the process could not be started
+            if error == QProcess.FailedToStart:
+                _set_detected_python_modules([], None)
+                proc.deleteLater()
+
+        proc.readyReadStandardOutput.connect(on_ready_read)
+        proc.finished.connect(on_finished)
+        proc.errorOccurred.connect(on_error)
+        # Use login shell so that 'module' is available; capture stderr as well
+        proc.start("bash", ["-lc", _MODULE_AV_COMMAND])
 
     def on_advanced_toggled(checked: bool) -> None:
         advanced_toggle.setArrowType(Qt.DownArrow if checked else Qt.RightArrow)
+        if advanced_content is None:
+            if not checked:
+                return
+            _build_advanced_content()
         advanced_content.setVisible(checked)
 
     advanced_toggle.toggled.connect(on_advanced_toggled)
+    _query_python_modules()
 
     # Bottom: centered Launch and Cancel buttons
     buttons_layout = QHBoxLayout()
@@ -164,8 +269,20 @@ def create_window(parent, context: Dict[str, Any]):
     def on_launch() -> None:
         selected_dir = startup_dir_edit.text().strip()
         selected_interface = "notebook" if notebook_radio.isChecked() else "lab"
-        selected_python_module_data = python_module_combo.currentData()
-        selected_python_module = str(selected_python_module_data or python_module_combo.currentText()).strip() or "python"
+        if python_module_combo is not None and python_module_combo.isEnabled():
+            selected_python_module_data = python_module_combo.currentData()
+            selected_python_module = str(selected_python_module_data or python_module_combo.currentText()).strip() or "python"
+        elif detected_python_modules is not None:
+            # Advanced never opened: same choice the combo would have preselected
+            selected_python_module = _preferred_python_module(*detected_python_modules)
+        else:
+            # Module query still running: fall back to an earlier (stale) result if any,
+            # and to bare "python" only when nothing has been detected yet
+            cached = _MODULE_CACHE.get(_MODULE_AV_COMMAND)
+            if cached is not None:
+                selected_python_module = _preferred_python_module(cached[1], cached[2])
+            else:
+                selected_python_module = "python"
         label = "Notebook" if selected_interface == "notebook" else "Lab"
         leaf = os.path.basename(os.path.normpath(selected_dir)) or selected_dir
 
@@ -183,46 +300,53 @@ def create_window(parent, context: Dict[str, Any]):
                 ["bash", "-lc", chained_cmd],
                 start_new_session=True,
             )
-            # Register started session with the launcher if possible
-            try:
-                if parent is not None:
-                    try:
-                        pgid = os.getpgid(proc.pid)
-                    except Exception:
-                        pgid = None
-                    label_full = f"Jupyter {label}: {leaf}"
-                    register_fn = getattr(parent, "register_started_session", None)
-                    if callable(register_fn):
-                        register_fn(proc.pid, label_full, pgid)
-            except Exception:
-                pass
-            # Record history if enabled
-            try:
-                if not dont_record_checkbox.isChecked() and parent is not None:
-                    # Provide a shell script for replay to keep the launcher generic
-                    script_lines = [
-                        "#!/usr/bin/env bash",
-                        "set -e",
-                        f"cd {shlex.quote(selected_dir)}",
-                        f"module load {shlex.quote(selected_python_module)}",
-                        "exec jupyter-notebook" if selected_interface == "notebook" else "exec jupyter-lab",
-                    ]
-                    replay_shell_script = "\n".join(script_lines) + "\n"
-                    history_entry = {
-                        "title": f"Jupyter {label}: {leaf}",
-                        "icon": "../Apps/Jupyter/Resources/Jupyter.png",
-                        "options": {
-                            "startup_dir": selected_dir,
-                            "interface": label,
-                            "python_module": selected_python_module,
-                        },
-                        "replay_shell_script": replay_shell_script,
-                    }
-                    record_fn = getattr(parent, "record_history", None)
-                    if callable(record_fn):
-                        record_fn(history_entry)
-            except Exception:
-                pass
+            # Read the checkbox now; registration itself runs after this handler returns
+            dont_record = dont_record_checkbox is not None and dont_record_checkbox.isChecked()
+
+            def _do_register(pid: int) -> None:
+                # Register started session with the launcher if possible
+                try:
+                    if parent is not None:
+                        try:
+                            pgid = os.getpgid(pid)
+                        except Exception:
+                            pgid = None
+                        label_full = f"Jupyter {label}: {leaf}"
+                        register_fn = getattr(parent, "register_started_session", None)
+                        if callable(register_fn):
+                            register_fn(pid, label_full, pgid)
+                except Exception:
+                    pass
+                # Record history if enabled
+                try:
+                    if not dont_record and parent is not None:
+                        # Provide a shell script for replay to keep the launcher generic
+                        script_lines = [
+                            "#!/usr/bin/env bash",
+                            "set -e",
+                            f"cd {shlex.quote(selected_dir)}",
+                            f"module load {shlex.quote(selected_python_module)}",
+                            "exec jupyter-notebook" if selected_interface == "notebook" else "exec jupyter-lab",
+                        ]
+                        replay_shell_script = "\n".join(script_lines) + "\n"
+                        history_entry = {
+                            "title": f"Jupyter {label}: {leaf}",
+                            "icon": "../Apps/Jupyter/Resources/Jupyter.png",
+                            "options": {
+                                "startup_dir": selected_dir,
+                                "interface": label,
+                                "python_module": selected_python_module,
+                            },
+                            "replay_shell_script": replay_shell_script,
+                        }
+                        record_fn = getattr(parent, "record_history", None)
+                        if callable(record_fn):
+                            record_fn(history_entry)
+                except Exception:
+                    pass
+
+            # Hand bookkeeping back to the event loop so the window closes right away
+            QTimer.singleShot(0, lambda pid=proc.pid: _do_register(pid))
             # Request the launcher to show the standard 5s launching countdown
             try:
                 if parent is not None:
@@ -247,7 +371,6 @@ def create_window(parent, context: Dict[str, Any]):
     root_layout.addLayout(startup_dir_layout)
     root_layout.addLayout(flavor_layout)
     root_layout.addWidget(advanced_toggle)
-    root_layout.addWidget(advanced_content)
     root_layout.addStretch(1)
     root_layout.addLayout(buttons_layout)
 
@@ -4,31 +4,96 @@ import argparse
 import json
 import os
 import sys
+import hashlib
 import importlib.util
 import html as html_lib
-import shlex
 import subprocess
 import signal
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from types import ModuleType
-from typing import Dict, List, Optional, Any
-
-from PyQt5.QtCore import Qt, QUrl, QSize, QObject, QEvent, QTimer
-from PyQt5.QtGui import QIcon
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Any, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is used without it
+    orjson = None  # type: ignore[assignment]
+
+from PyQt5.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QModelIndex,
+    QUrl,
+    QSize,
+    QObject,
+    QEvent,
+    QTimer,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+)
+from PyQt5.QtGui import QIcon, QPixmap, QPixmapCache
 from PyQt5.QtWidgets import (
     QApplication,
     QMainWindow,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QSplitter,
-    QWidget,
+    QStackedWidget,
+    QTextBrowser,
     QStyle,
     QToolBar,
     QAction,
     QProgressDialog,
     QMessageBox,
 )
-from PyQt5.QtWebEngineWidgets import QWebEngineView
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime: QtWebEngine bootstraps Chromium on import
+    from PyQt5.QtWebEngineWidgets import QWebEngineView
+
+
+_DESCRIPTOR_LOAD_WORKERS = 8
+_ICON_LAYOUT_BATCH_SIZE = 100
+# Details page written next to each history entry; options_html is "" or a full <ul> block
+_HISTORY_HTML_TEMPLATE = (
+    "<!DOCTYPE html>\n"
+    "<html>\n"
+    "  <head>\n"
+    "    <meta charset=\"utf-8\">\n"
+    "    <title>{title}</title>\n"
+    "  </head>\n"
+    "  <body>\n"
+    "    <h2>{title}</h2>\n"
+    "{options_html}"
+    "  </body>\n"
+    "</html>"
+)
+# Sidecar folder in the root objects folder: parsed descriptors, one file per directory
+_DESCRIPTOR_DISK_CACHE_DIR = ".launcher_cache"
+_SMALL_FILE_READ_SIZE = 65536
+# Signals Python sets to SIG_IGN at startup that children should get back at default
+_RESTORED_SIGNALS = tuple(getattr(signal, name) for name in ("SIGPIPE", "SIGXFSZ") if hasattr(signal, name))
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize obj as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_dumps_pretty(obj: Any) -> bytes:
+    """Serialize obj as UTF-8 JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
 
 
 def resolve_base_path(cli_base_path: Optional[str]) -> str:
@@ -58,26 +123,82 @@ def _resolve_app_icon_path() -> Optional[str]:
 
 def find_object_files(base_path: str) -> List[str]:
     """Return a list of absolute paths to all *.json object files in base_path."""
-    if not os.path.isdir(base_path):
-        return []
     object_files: List[str] = []
     try:
-        for entry in os.listdir(base_path):
-            if entry.lower().endswith(".json"):
-                object_files.append(os.path.join(base_path, entry))
+        # A single scandir pass: name and file type come from the directory
+        # listing itself, and a missing directory simply raises here
+        with os.scandir(base_path) as it:
+            for entry in it:
+                # Dotfiles (e.g. the descriptor cache) are never objects; the suffix
+                # test lower-cases only the last five characters, not the whole name
+                name = entry.name
+                if not name.startswith(".") and name[-5:].lower() == ".json" and entry.is_file():
+                    object_files.append(entry.path)
     except Exception:
         # Fail silent; return what we have
         pass
     return sorted(object_files)
 
 
-def load_object_descriptor(json_path: str) -> Optional[Dict[str, str]]:
-    """Load a single object JSON and return its dictionary or None on failure."""
+@dataclass
+class Descriptor:
+    """An object descriptor with the fields the launcher reads, parsed once at load time.
+
+    Fields are None when absent or of the wrong type. The original mapping is
+    kept in raw for plugins and the on-disk descriptor cache.
+    """
+
+    __slots__ = ("title", "icon", "details", "openaction_command", "openaction_arg0", "raw")
+
+    title: Optional[str]
+    icon: Optional[str]
+    details: Optional[str]
+    openaction_command: Optional[str]
+    openaction_arg0: Optional[str]
+    raw: Dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Descriptor":
+        def text(value: Any) -> Optional[str]:
+            return value if isinstance(value, str) and value else None
+
+        title = data.get("title")
+        open_action = data.get("openaction")
+        if not isinstance(open_action, dict):
+            open_action = {}
+        # Interned so dispatch on "path"/"python"/"shell" matches by identity
+        command = text(open_action.get("command"))
+        return cls(
+            title=str(title) if title else None,
+            icon=text(data.get("icon")),
+            details=text(data.get("details")),
+            openaction_command=sys.intern(command) if command else None,
+            openaction_arg0=text(open_action.get("arg0")),
+            raw=data,
+        )
+
+
+def _read_file_bytes(path: str) -> bytes:
+    """Read a whole file with raw os.read calls, skipping the buffered io stack."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # Descriptors are almost always a few KB: one read, then the EOF read
+        chunks = []
+        chunk = os.read(fd, _SMALL_FILE_READ_SIZE)
+        while chunk:
+            chunks.append(chunk)
+            chunk = os.read(fd, _SMALL_FILE_READ_SIZE)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def load_object_descriptor(json_path: str) -> Optional[Descriptor]:
+    """Load a single object JSON and return its Descriptor or None on failure."""
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, dict):
-                return data  # type: ignore[return-value]
+        data = _json_loads(_read_file_bytes(json_path))
+        if isinstance(data, dict):
+            return Descriptor.from_dict(data)
     except Exception:
         return None
     return None
@@ -109,11 +230,123 @@ def resolve_icon_path(base_path: str, icon_value: Optional[str]) -> Optional[str
     return None
 
 
+def spawn_login_shell_script(script_path: str) -> int:
+    """Run script_path under a bash login shell in a new session and return its PID.
+
+    Uses posix_spawn where available, which avoids fork() copying the whole
+    GUI process just to exec bash. The login shell keeps 'module' available.
+    """
+    argv = ["bash", "-l", script_path]
+    if hasattr(os, "posix_spawnp"):
+        try:
+            # Match Popen(restore_signals=True): Python ignores these, and the
+            # script (and whatever it execs) must not inherit that
+            return os.posix_spawnp("bash", argv, os.environ, setsid=True, setsigdef=_RESTORED_SIGNALS)
+        except (NotImplementedError, OSError):
+            # setsid needs glibc >= 2.26; older login nodes take the Popen path
+            pass
+    return subprocess.Popen(argv, start_new_session=True).pid
+
+
+def import_plugin_module(plugin_file: str) -> Optional[ModuleType]:
+    """Import a plugin module from a file path and return it or None on failure.
+
+    The module is registered in sys.modules under a name derived from its
+    absolute path, so re-importing a changed plugin replaces the old entry.
+    """
+    digest = hashlib.blake2b(os.path.abspath(plugin_file).encode("utf-8"), digest_size=8).hexdigest()
+    module_name = f"plugin_{digest}"
+    try:
+        spec = importlib.util.spec_from_file_location(module_name, plugin_file)
+        if spec is None or spec.loader is None:
+            return None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)  # type: ignore[attr-defined]
+        return module
+    except Exception:
+        sys.modules.pop(module_name, None)
+        return None
+
+
+class _PluginImportSignals(QObject):
+    # Lives on the GUI thread, so emissions from worker threads are queued back to it
+    loaded = pyqtSignal(str, float, object, object)
+    failed = pyqtSignal(object)
+
+
+class _PluginImportTask(QRunnable):
+    """Import a plugin module on a pool thread. Never touches widgets."""
+
+    def __init__(self, plugin_file: str, context: Dict[str, Any], signals: _PluginImportSignals) -> None:
+        super().__init__()
+        self.plugin_file = plugin_file
+        self.context = context
+        self.signals = signals
+
+    def run(self) -> None:
+        # Take the mtime before importing so a concurrent edit invalidates the cache entry
+        try:
+            mtime = os.stat(self.plugin_file).st_mtime
+        except Exception:
+            self.signals.failed.emit(self.context)
+            return
+        module = import_plugin_module(self.plugin_file)
+        if module is None:
+            self.signals.failed.emit(self.context)
+        else:
+            self.signals.loaded.emit(self.plugin_file, mtime, module, self.context)
+
+
+class ObjectsModel(QAbstractListModel):
+    """List model behind the icon grid: one row per object descriptor.
+
+    Rows are (title, json_path, icon_path, descriptor). Replacing the folder's
+    rows is a single model reset instead of destroying and recreating list
+    items. Icons are built by icon_provider the first time the view asks for
+    a row's decoration, so images are only decoded for items actually shown.
+    """
+
+    DescriptorRole = Qt.UserRole
+    JsonPathRole = Qt.UserRole + 1
+
+    def __init__(self, icon_provider: Callable[[Optional[str]], QIcon], parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._icon_provider = icon_provider
+        self._items: List[Tuple[str, str, Optional[str], Descriptor]] = []
+
+    def set_items(self, items: List[Tuple[str, str, Optional[str], Descriptor]]) -> None:
+        self.beginResetModel()
+        self._items = items
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if not index.isValid() or not 0 <= index.row() < len(self._items):
+            return None
+        title, json_path, icon_path, descriptor = self._items[index.row()]
+        if role == Qt.DisplayRole:
+            return title
+        if role == Qt.DecorationRole:
+            return self._icon_provider(icon_path)
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignHCenter | Qt.AlignTop)
+        if role == self.DescriptorRole:
+            return descriptor
+        if role == self.JsonPathRole:
+            return json_path
+        return None
+
+
 class LauncherWindow(QMainWindow):
     def __init__(self, base_path: str) -> None:
         super().__init__()
         self.base_path = os.path.abspath(base_path)
-        # Keep a stable root for app-owned assets (e.g., History) regardless of CLI base
+        # Keep a stable root for app-owned assets (e.g., History) regardless of CLI base.
+        # Both paths are absolute and normalized from here on, so comparisons and
+        # joins against them never need another abspath()
         try:
             script_dir = os.path.dirname(os.path.abspath(__file__))
             self.root_base_path = os.path.join(script_dir, "Objects")
@@ -121,6 +354,26 @@ class LauncherWindow(QMainWindow):
             self.root_base_path = self.base_path
         self.child_windows: List[Any] = []
         self.started_sessions: List[Dict[str, Any]] = []
+        # Directory -> {JSON path -> (mtime_ns, size, descriptor)}. A directory's entries
+        # are read from its sidecar file when first browsed and written back only when
+        # they change, so unchanged descriptors are not re-parsed on the next launch
+        self._descriptor_cache: Dict[str, Dict[str, Tuple[int, int, Descriptor]]] = {}
+        self._descriptor_cache_dirty = False
+        self._descriptor_cache_dir = os.path.join(self.root_base_path, _DESCRIPTOR_DISK_CACHE_DIR)
+        self._icon_cache: Dict[str, QIcon] = {}
+        # Plugin modules are imported off the GUI thread; windows are built on it
+        self._plugin_progress: Optional[QProgressDialog] = None
+        # Imported plugin modules keyed by file path, invalidated by mtime
+        self._plugin_module_cache: Dict[str, Tuple[float, ModuleType]] = {}
+        self._plugin_signals = _PluginImportSignals(self)
+        self._plugin_signals.loaded.connect(self._on_plugin_loaded)
+        self._plugin_signals.failed.connect(self._on_plugin_failed)
+        # openaction command -> handler(resolved_arg0, descriptor, json_path)
+        self._openaction_dispatch: Dict[str, Callable[[str, Descriptor, str], None]] = {
+            "path": self._open_path,
+            "python": self._open_python,
+            "shell": self._open_shell,
+        }
 
         self.setWindowTitle("HPC Desktop Launcher")
         icon_path = _resolve_app_icon_path()
@@ -131,74 +384,237 @@ class LauncherWindow(QMainWindow):
         # Breadcrumb toolbar (top)
         self.breadcrumbs = QToolBar("Navigation")
         self.addToolBar(self.breadcrumbs)
+        # Actions per crumb (leading arrow + crumb) and the (label, path) they were built for
+        self._crumb_actions: List[List[QAction]] = []
+        self._crumb_targets: List[Tuple[str, str]] = []
 
         # Splitter for resizable layout: left 2/3, right 1/3
         self.splitter = QSplitter(Qt.Horizontal)
         self.setCentralWidget(self.splitter)
 
         # Left: icon grid
-        self.icon_list = QListWidget()
-        self.icon_list.setViewMode(QListWidget.IconMode)
+        self.objects_model = ObjectsModel(self._icon_for_path, self)
+        self.icon_list = QListView()
+        self.icon_list.setModel(self.objects_model)
+        # Lay out large folders in batches so the first screenful paints immediately
+        self.icon_list.setLayoutMode(QListView.Batched)
+        self.icon_list.setBatchSize(_ICON_LAYOUT_BATCH_SIZE)
+        self.icon_list.setViewMode(QListView.IconMode)
         self.icon_list.setIconSize(QSize(96, 96))
-        self.icon_list.setResizeMode(QListWidget.Adjust)
-        self.icon_list.setMovement(QListWidget.Static)
+        self.icon_list.setResizeMode(QListView.Adjust)
+        self.icon_list.setMovement(QListView.Static)
         self.icon_list.setUniformItemSizes(False)
         self.icon_list.setWordWrap(True)
         self.icon_list.setSpacing(12)
-
-        # Right: web view for index.html
-        self.web_view = QWebEngineView()
+        # Fallback for objects without a usable icon; looked up from the style once
+        self._default_icon = self.style().standardIcon(QStyle.SP_FileIcon)
+
+        # Right: details pane. Starting QtWebEngine spawns a Chromium renderer, so
+        # the web view is only created by _ensure_web_view() once a real page is
+        # loaded; inline fallback pages are shown in a plain QTextBrowser instead
+        self.web_view: Optional["QWebEngineView"] = None
+        self._text_view = QTextBrowser()
+        self.details_stack = QStackedWidget()
+        self.details_stack.addWidget(self._text_view)
+        # URL we last loaded, so re-selecting the same page skips a navigation
+        self._current_web_url: Optional[QUrl] = None
+        # Expected index.html path while the inline "not found" page is displayed
+        # (the web view keeps its page underneath, so _current_web_url stays valid)
+        self._missing_index_shown: Optional[str] = None
 
         self.splitter.addWidget(self.icon_list)
-        self.splitter.addWidget(self.web_view)
+        self.splitter.addWidget(self.details_stack)
 
         # Set stretch so that left is 2/3, right is 1/3
         self.splitter.setStretchFactor(0, 2)
         self.splitter.setStretchFactor(1, 1)
 
         self.populate_objects()
-        self.load_index_html()
         self.update_breadcrumbs()
+        # Let the icon grid paint before the web engine starts up
+        QTimer.singleShot(0, self.load_index_html)
+
+        # Coalesce bursts of selection changes (rubber band, arrow keys) into one page load
+        self._sel_timer = QTimer(self)
+        self._sel_timer.setSingleShot(True)
+        self._sel_timer.setInterval(50)
+        self._sel_timer.timeout.connect(self._apply_selection)
 
         # Hook selection changes and click behavior
-        self.icon_list.itemSelectionChanged.connect(self._on_selection_changed)
-        self.icon_list.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.icon_list.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.icon_list.doubleClicked.connect(self._on_item_double_clicked)
         self.icon_list.viewport().installEventFilter(self)
 
-    def populate_objects(self) -> None:
-        object_files = find_object_files(self.base_path)
-        for json_path in object_files:
-            descriptor = load_object_descriptor(json_path)
-            if not descriptor:
+    def _descriptor_cache_file(self, directory: str) -> str:
+        digest = hashlib.blake2b(directory.encode("utf-8"), digest_size=8).hexdigest()
+        return os.path.join(self._descriptor_cache_dir, f"{digest}.json")
+
+    def _load_descriptor_disk_cache(self, directory: str) -> Dict[str, Tuple[int, int, Descriptor]]:
+        """Return the cached descriptors for directory, reading its sidecar file on first use."""
+        entries = self._descriptor_cache.get(directory)
+        if entries is not None:
+            return entries
+        entries = {}
+        self._descriptor_cache[directory] = entries
+        try:
+            data = _json_loads(_read_file_bytes(self._descriptor_cache_file(directory)))
+        except Exception:
+            return entries
+        if not isinstance(data, dict):
+            return entries
+        for json_path, entry in data.items():
+            try:
+                mtime_ns, size, descriptor = entry
+            except Exception:
                 continue
+            if not (isinstance(mtime_ns, int) and isinstance(size, int) and isinstance(descriptor, dict)):
+                continue
+            if os.path.dirname(json_path) == directory:
+                entries[json_path] = (mtime_ns, size, Descriptor.from_dict(descriptor))
+        return entries
+
+    def _save_descriptor_disk_cache(self, directory: str) -> None:
+        """Write one directory's cached descriptors to its sidecar file. Silently no-op on error."""
+        self._descriptor_cache_dirty = False
+        entries = self._descriptor_cache.get(directory, {})
+        payload: Dict[str, Any] = {}
+        for json_path, (mtime_ns, size, descriptor) in entries.items():
+            payload[json_path] = [mtime_ns, size, descriptor.raw]
+        cache_file = self._descriptor_cache_file(directory)
+        tmp_path = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self._descriptor_cache_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(_json_dumps(payload))
+            # Replace atomically so a concurrent launcher never reads a partial file
+            os.replace(tmp_path, cache_file)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except Exception:
+                pass
 
-            title = str(descriptor.get("title") or os.path.splitext(os.path.basename(json_path))[0])
-            icon_path = resolve_icon_path(self.base_path, descriptor.get("icon"))
-
-            # Build item with icon and text
-            item = QListWidgetItem()
-            item.setText(title)
-            item.setTextAlignment(Qt.AlignHCenter | Qt.AlignTop)
+    def _load_object_entry(self, json_path: str) -> Tuple[Optional[Descriptor], Optional[str]]:
+        """Return (descriptor, icon path) for json_path, re-parsing only when the file changed.
 
-            if icon_path and os.path.isfile(icon_path):
-                item.setIcon(QIcon(icon_path))
+        A descriptor is reused only if both mtime and size match, since coarse mtime
+        granularity (common on NFS) can hide an edit. The icon is resolved on every
+        call: it is a separate file that can appear or disappear without the JSON
+        changing. The directory's cache must already be loaded. Safe to run off the
+        GUI thread.
+        """
+        entries = self._descriptor_cache[os.path.dirname(json_path)]
+        try:
+            st = os.stat(json_path)
+        except Exception:
+            if entries.pop(json_path, None) is not None:
+                self._descriptor_cache_dirty = True
+            return None, None
+        cached = entries.get(json_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            descriptor = cached[2]
+        else:
+            descriptor = load_object_descriptor(json_path)
+            if descriptor is None:
+                if entries.pop(json_path, None) is not None:
+                    self._descriptor_cache_dirty = True
+                return None, None
+            entries[json_path] = (st.st_mtime_ns, st.st_size, descriptor)
+            self._descriptor_cache_dirty = True
+        return descriptor, resolve_icon_path(os.path.dirname(json_path), descriptor.icon)
+
+    def _icon_for_path(self, icon_path: Optional[str]) -> QIcon:
+        # resolve_icon_path only returns paths it has verified to exist;
+        # otherwise use the graceful fallback icon
+        if not icon_path:
+            return self._default_icon
+        icon = self._icon_cache.get(icon_path)
+        if icon is None:
+            # Decode through the process-wide pixmap cache so an image shared by
+            # several objects (e.g. history entries) is read and decoded once
+            cache_key = f"launcher-icon:{icon_path}"
+            pixmap = QPixmapCache.find(cache_key)
+            if pixmap is None or pixmap.isNull():
+                pixmap = QPixmap(icon_path)
+                if not pixmap.isNull():
+                    QPixmapCache.insert(cache_key, pixmap)
+            if not pixmap.isNull():
+                icon = QIcon(pixmap)
+            elif os.path.isfile(icon_path):
+                icon = QIcon(icon_path)
             else:
-                # Graceful fallback icon if missing
-                item.setIcon(self.style().standardIcon(QStyle.SP_FileIcon))
+                # The file vanished after resolve_icon_path checked it; remember the
+                # fallback so repaints don't retry the decode and stat on every request
+                icon = self._default_icon
+            self._icon_cache[icon_path] = icon
+        return icon
 
-            # Store descriptor and json path on the item for later use
-            item.setData(Qt.UserRole, descriptor)
-            item.setData(Qt.UserRole + 1, json_path)
-            self.icon_list.addItem(item)
+    def populate_objects(self) -> None:
+        object_files = find_object_files(self.base_path)
+        cached_entries = self._load_descriptor_disk_cache(self.base_path)
+        # Load descriptors and stat their icons concurrently so file-system latency
+        # (NFS, sshfs) overlaps; only Qt object construction has to stay on this thread
+        if len(object_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(_DESCRIPTOR_LOAD_WORKERS, len(object_files))) as executor:
+                entries = list(executor.map(self._load_object_entry, object_files))
+        else:
+            entries = [self._load_object_entry(p) for p in object_files]
+
+        items: List[Tuple[str, str, Optional[str], Descriptor]] = []
+        for json_path, (descriptor, icon_path) in zip(object_files, entries):
+            if descriptor is None:
+                continue
+
+            title = descriptor.title or os.path.splitext(os.path.basename(json_path))[0]
+            items.append((title, json_path, icon_path, descriptor))
+
+        # One model reset lays the grid out once for the whole folder
+        self.objects_model.set_items(items)
+
+        # Forget descriptors deleted from this folder, then persist any changes
+        listed = set(object_files)
+        for json_path in [p for p in cached_entries if p not in listed]:
+            del cached_entries[json_path]
+            self._descriptor_cache_dirty = True
+        if self._descriptor_cache_dirty:
+            self._save_descriptor_disk_cache(self.base_path)
+
+    def _ensure_web_view(self) -> "QWebEngineView":
+        if self.web_view is None:
+            # Deferred until the first details page so startup never waits on Chromium
+            from PyQt5.QtWebEngineWidgets import QWebEngineView
+
+            self.web_view = QWebEngineView()
+            self.web_view.urlChanged.connect(self._on_web_url_changed)
+            self.details_stack.addWidget(self.web_view)
+        return self.web_view
+
+    def _on_web_url_changed(self, url: QUrl) -> None:
+        # The user followed a link inside the page; the next load must not be skipped
+        if url != self._current_web_url:
+            self._current_web_url = None
+
+    def _load_web_url(self, url: QUrl) -> None:
+        web_view = self._ensure_web_view()
+        self.details_stack.setCurrentWidget(web_view)
+        self._missing_index_shown = None
+        if url == self._current_web_url:
+            return
+        web_view.load(url)
+        self._current_web_url = url
 
     def load_index_html(self) -> None:
         index_html_path = os.path.join(self.base_path, "index.html")
         if os.path.isfile(index_html_path):
-            url = QUrl.fromLocalFile(os.path.abspath(index_html_path))
-            self.web_view.load(url)
+            url = QUrl.fromLocalFile(index_html_path)
+            self._load_web_url(url)
         else:
             # Minimal inline content if file is absent
-            self.web_view.setHtml(
+            if self._missing_index_shown == index_html_path:
+                return
+            self._missing_index_shown = index_html_path
+            self.details_stack.setCurrentWidget(self._text_view)
+            self._text_view.setHtml(
                 """
                 <!DOCTYPE html>
                 <html>
@@ -211,117 +627,114 @@ class LauncherWindow(QMainWindow):
                 """.format(index_html_path)
             )
 
-    def load_details_for_descriptor(self, descriptor: Dict[str, str]) -> None:
-        details_value = descriptor.get("details")
+    def load_details_for_descriptor(self, descriptor: Descriptor) -> None:
+        details_value = descriptor.details
         if not details_value:
             # No details -> load index.html
             self.load_index_html()
             return
         # Resolve details path relative to base_path unless absolute
-        details_path = details_value
-        if not os.path.isabs(details_path):
-            details_path = os.path.abspath(os.path.join(self.base_path, details_path))
+        details_path = self._resolve_relative(details_value)
 
         if os.path.isfile(details_path):
-            self.web_view.load(QUrl.fromLocalFile(details_path))
+            self._load_web_url(QUrl.fromLocalFile(details_path))
         else:
             # Fallback to index.html if details file not found
             self.load_index_html()
 
-    def _on_selection_changed(self) -> None:
-        selected_items = self.icon_list.selectedItems()
-        if not selected_items:
+    def _on_selection_changed(self, *_args: Any) -> None:
+        self._sel_timer.start()
+
+    def _apply_selection(self) -> None:
+        selected_indexes = self.icon_list.selectionModel().selectedIndexes()
+        if not selected_indexes:
             # No selection -> show index.html
             self.load_index_html()
             return
-        item = selected_items[0]
-        descriptor = item.data(Qt.UserRole) or {}
-        if isinstance(descriptor, dict):
+        index = selected_indexes[0]
+        descriptor = index.data(ObjectsModel.DescriptorRole)
+        if isinstance(descriptor, Descriptor):
             self.load_details_for_descriptor(descriptor)
         else:
             self.load_index_html()
 
-    def _on_item_double_clicked(self, item: QListWidgetItem) -> None:
-        descriptor = item.data(Qt.UserRole) or {}
-        if not isinstance(descriptor, dict):
+    def _on_item_double_clicked(self, index: QModelIndex) -> None:
+        descriptor = index.data(ObjectsModel.DescriptorRole)
+        if not isinstance(descriptor, Descriptor):
             return
-        json_path = item.data(Qt.UserRole + 1) or ""
+        json_path = index.data(ObjectsModel.JsonPathRole) or ""
         if isinstance(json_path, str):
             self.execute_openaction(descriptor, json_path)
         return
 
-    def execute_openaction(self, descriptor: Dict[str, str], json_path: str) -> None:
-        open_action = descriptor.get("openaction")
-        if not isinstance(open_action, dict):
-            return
-        command = open_action.get("command")
-        arg0 = open_action.get("arg0")
-        if not isinstance(arg0, str) or not arg0:
+    def execute_openaction(self, descriptor: Descriptor, json_path: str) -> None:
+        arg0 = descriptor.openaction_arg0
+        if not arg0:
             return
-
-        if command == "path":
-            # Resolve new base path
-            new_base = arg0 if os.path.isabs(arg0) else os.path.abspath(os.path.join(self.base_path, arg0))
-            if os.path.isdir(new_base):
-                self.change_base_path(new_base)
-            return
-
-        if command == "python":
-            # Resolve plugin file path
-            plugin_path = arg0 if os.path.isabs(arg0) else os.path.abspath(os.path.join(self.base_path, arg0))
-            if os.path.isfile(plugin_path):
-                context = {
-                    "base_path": self.base_path,
-                    "root_base_path": self.root_base_path,
-                    "descriptor": descriptor,
-                    "json_path": json_path,
-                }
-                # Show a working indicator while the plugin is being loaded
-                progress = QProgressDialog("Launching…", None, 0, 0, self)
-                progress.setWindowTitle("Please wait")
-                progress.setWindowModality(Qt.WindowModal)
-                progress.setCancelButton(None)
-                progress.setAutoClose(True)
-                progress.setAutoReset(True)
-                progress.setMinimumDuration(0)
-                progress.show()
-                try:
-                    # Process events to ensure the dialog appears immediately
-                    QApplication.processEvents()
-                    self.run_python_plugin(plugin_path, context)
-                finally:
-                    try:
-                        progress.close()
-                    except Exception:
-                        pass
+        handler = self._openaction_dispatch.get(descriptor.openaction_command)
+        if handler is not None:
+            handler(self._resolve_relative(arg0), descriptor, json_path)
+
+    def _resolve_relative(self, arg0: str) -> str:
+        """Resolve an openaction argument against the current folder."""
+        if os.path.isabs(arg0):
+            return arg0
+        # base_path is already absolute, so normpath gives the same result as abspath
+        return os.path.normpath(os.path.join(self.base_path, arg0))
+
+    def _open_path(self, new_base: str, descriptor: Descriptor, json_path: str) -> None:
+        if os.path.isdir(new_base):
+            self.change_base_path(new_base)
+
+    def _open_python(self, plugin_path: str, descriptor: Descriptor, json_path: str) -> None:
+        if not os.path.isfile(plugin_path):
             return
+        context = {
+            "base_path": self.base_path,
+            "root_base_path": self.root_base_path,
+            "descriptor": descriptor.raw,
+            "json_path": json_path,
+        }
+        # Show a working indicator while the plugin is being loaded
+        progress = QProgressDialog("Launching…", None, 0, 0, self)
+        progress.setWindowTitle("Please wait")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setCancelButton(None)
+        progress.setAutoClose(True)
+        progress.setAutoReset(True)
+        progress.setMinimumDuration(0)
+        progress.show()
+        # Closed again by _on_plugin_loaded / _on_plugin_failed
+        self._plugin_progress = progress
+        try:
+            self.run_python_plugin(plugin_path, context)
+        except Exception:
+            self._close_plugin_progress()
 
-        if command == "shell":
-            # Resolve and execute a shell script (login shell to access 'module')
-            script_path = arg0 if os.path.isabs(arg0) else os.path.abspath(os.path.join(self.base_path, arg0))
-            if os.path.isfile(script_path):
-                try:
-                    proc = subprocess.Popen(["bash", "-lc", shlex.quote(script_path)], start_new_session=True)
-                    try:
-                        pgid = os.getpgid(proc.pid)
-                    except Exception:
-                        pgid = None
-                    # Use title from descriptor if present; else script basename
-                    label = str(descriptor.get("title") or os.path.basename(script_path))
-                    self.register_started_session(proc.pid, label, pgid)
-                    # Show the shared 5s launching dialog after starting from History
-                    self.show_launching_countdown(5)
-                except Exception:
-                    pass
+    def _open_shell(self, script_path: str, descriptor: Descriptor, json_path: str) -> None:
+        # Execute a shell script (login shell to access 'module')
+        if not os.path.isfile(script_path):
             return
+        try:
+            pid = spawn_login_shell_script(script_path)
+            try:
+                pgid = os.getpgid(pid)
+            except Exception:
+                pgid = None
+            # Use title from descriptor if present; else script basename
+            label = descriptor.title or os.path.basename(script_path)
+            self.register_started_session(pid, label, pgid)
+            # Show the shared 5s launching dialog after starting from History
+            self.show_launching_countdown(5)
+        except Exception:
+            pass
 
     def eventFilter(self, watched: QObject, event: QEvent) -> bool:
         # Detect clicks on empty area to clear selection
         if watched is self.icon_list.viewport():
             if event.type() == QEvent.MouseButtonPress:
                 pos = event.pos()
-                item_at_pos: Optional[QListWidgetItem] = self.icon_list.itemAt(pos)
-                if item_at_pos is None:
+                if not self.icon_list.indexAt(pos).isValid():
                     # Click into empty area -> clear selection
                     self.icon_list.clearSelection()
                     # Ensure right view shows index.html
@@ -331,7 +744,6 @@ class LauncherWindow(QMainWindow):
     def change_base_path(self, new_base_path: str) -> None:
         self.base_path = os.path.abspath(new_base_path)
         # Repopulate objects and refresh right panel
-        self.icon_list.clear()
         self.populate_objects()
         self.load_index_html()
         self.update_breadcrumbs()
@@ -384,6 +796,16 @@ class LauncherWindow(QMainWindow):
             pass
 
     def _is_process_alive(self, pid: int) -> bool:
+        try:
+            # Reap our own exited children (posix_spawn leaves no Popen to do it);
+            # a zombie would otherwise still answer signal 0
+            if os.waitpid(pid, os.WNOHANG)[0] == pid:
+                return False
+        except ChildProcessError:
+            # Not our child, or already reaped elsewhere
+            pass
+        except Exception:
+            pass
         try:
             # Signal 0 checks existence without sending a signal
             os.kill(pid, 0)
@@ -502,41 +924,72 @@ class LauncherWindow(QMainWindow):
             # On error, proceed with default behavior
             return super().closeEvent(event)
 
-    def update_breadcrumbs(self) -> None:
-        # Clear existing actions
-        self.breadcrumbs.clear()
-
-        def add_action(label: str, target_path: str) -> None:
-            # Insert a small arrow before every crumb after the first
-            if self.breadcrumbs.actions():
-                arrow = QAction("->", self)
-                arrow.setEnabled(False)
-                arrow.setSeparator(False)
-                self.breadcrumbs.addAction(arrow)
-
-            action = QAction(label, self)
-            action.triggered.connect(lambda _=False, p=target_path: self.change_base_path(p))
-            self.breadcrumbs.addAction(action)
-
+    def _breadcrumb_targets(self) -> List[Tuple[str, str]]:
+        """Return (label, target_path) for each crumb from Home to the current folder."""
         # Always provide Home (root)
-        add_action("Home", self.root_base_path)
+        targets = [("Home", self.root_base_path)]
 
         # If current equals root, we're done
-        if os.path.abspath(self.base_path) == os.path.abspath(self.root_base_path):
+        if self.base_path == self.root_base_path:
+            return targets
+
+        # Both paths are absolute and normalised, so a prefix test replaces relpath
+        root = self.root_base_path
+        prefix = root if root.endswith(os.sep) else root + os.sep
+        if not self.base_path.startswith(prefix):
+            # Fallback: show current base as a single crumb
+            targets.append((self.base_path, self.base_path))
+            return targets
+        accum = prefix[:-1]
+        for part in self.base_path[len(prefix):].split(os.sep):
+            if part:
+                accum += os.sep + part
+                targets.append((part, accum))
+        return targets
+
+    def update_breadcrumbs(self) -> None:
+        targets = self._breadcrumb_targets()
+
+        # Keep the crumbs shared with the previous folder and only rebuild the tail
+        keep = 0
+        while (
+            keep < len(targets)
+            and keep < len(self._crumb_targets)
+            and targets[keep] == self._crumb_targets[keep]
+        ):
+            keep += 1
+        if keep == len(targets) == len(self._crumb_targets):
             return
 
+        # Repaint the toolbar once for the whole change, not per action
+        self.breadcrumbs.setUpdatesEnabled(False)
         try:
-            rel = os.path.relpath(self.base_path, self.root_base_path)
-            if rel == ".":
-                return
-            parts = [p for p in rel.split(os.sep) if p]
-            accum = self.root_base_path
-            for part in parts:
-                accum = os.path.join(accum, part)
-                add_action(part, accum)
-        except Exception:
-            # Fallback: show current base as a single crumb
-            add_action(self.base_path, self.base_path)
+            for actions in self._crumb_actions[keep:]:
+                for action in actions:
+                    self.breadcrumbs.removeAction(action)
+                    action.deleteLater()
+            del self._crumb_actions[keep:]
+            del self._crumb_targets[keep:]
+
+            for label, target_path in targets[keep:]:
+                actions: List[QAction] = []
+                # Insert a small arrow before every crumb after the first
+                if self._crumb_actions:
+                    arrow = QAction("->", self)
+                    arrow.setEnabled(False)
+                    arrow.setSeparator(False)
+                    self.breadcrumbs.addAction(arrow)
+                    actions.append(arrow)
+
+                action = QAction(label, self)
+                action.triggered.connect(lambda _=False, p=target_path: self.change_base_path(p))
+                self.breadcrumbs.addAction(action)
+                actions.append(action)
+
+                self._crumb_actions.append(actions)
+                self._crumb_targets.append((label, target_path))
+        finally:
+            self.breadcrumbs.setUpdatesEnabled(True)
 
     def record_history(self, entry: Dict[str, str]) -> None:
         """Create a history JSON file under <root_base_path>/History/.
@@ -558,16 +1011,19 @@ class LauncherWindow(QMainWindow):
             except Exception:
                 return
 
-            # Build a filename based on timestamp; ensure uniqueness
+            # Build a filename based on timestamp; claim it with O_EXCL so the
+            # common case costs one open() and a collision just tries the next suffix
             import datetime
             timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
-            base_name = f"{timestamp}.json"
-            target_path = os.path.join(history_dir, base_name)
+            target_path = os.path.join(history_dir, f"{timestamp}.json")
             counter = 1
-            while os.path.exists(target_path):
-                base_name = f"{timestamp}-{counter}.json"
-                target_path = os.path.join(history_dir, base_name)
-                counter += 1
+            while True:
+                try:
+                    json_fd = os.open(target_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+                    break
+                except FileExistsError:
+                    target_path = os.path.join(history_dir, f"{timestamp}-{counter}.json")
+                    counter += 1
 
             # Pre-compute sibling HTML path for details reference
             html_path = os.path.splitext(target_path)[0] + ".html"
@@ -595,38 +1051,28 @@ class LauncherWindow(QMainWindow):
                 "icon": icon,
                 "details": os.path.basename(html_path),
             }
-            if wrote_shell and os.path.isfile(sh_path):
+            if wrote_shell:
                 payload["openaction"] = {
                     "command": "shell",
                     "arg0": os.path.basename(sh_path),
                 }
-            with open(target_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False, indent=2)
+            with os.fdopen(json_fd, "wb") as f:
+                f.write(_json_dumps_pretty(payload))
 
             # Also write an .html file with the same stem documenting options
             try:
-                parts = [
-                    "<!DOCTYPE html>",
-                    "<html>",
-                    "  <head>",
-                    "    <meta charset=\"utf-8\">",
-                    f"    <title>{html_lib.escape(title)}</title>",
-                    "  </head>",
-                    "  <body>",
-                    f"    <h2>{html_lib.escape(title)}</h2>",
-                ]
+                options_html = ""
                 if isinstance(options, dict) and options:
-                    parts.append("    <h3>Launch Options</h3>")
-                    parts.append("    <ul>")
-                    for key, value in options.items():
-                        parts.append(
-                            f"      <li><strong>{html_lib.escape(str(key))}:</strong> {html_lib.escape(str(value))}</li>"
+                    options_html = (
+                        "    <h3>Launch Options</h3>\n    <ul>\n"
+                        + "".join(
+                            f"      <li><strong>{html_lib.escape(str(key))}:</strong> {html_lib.escape(str(value))}</li>\n"
+                            for key, value in options.items()
                         )
-                    parts.append("    </ul>")
-                parts.append("  </body>")
-                parts.append("</html>")
+                        + "    </ul>\n"
+                    )
                 with open(html_path, "w", encoding="utf-8") as hf:
-                    hf.write("\n".join(parts))
+                    hf.write(_HISTORY_HTML_TEMPLATE.format(title=html_lib.escape(title), options_html=options_html))
             except Exception:
                 pass
         except Exception:
@@ -634,16 +1080,40 @@ class LauncherWindow(QMainWindow):
             return
 
     def run_python_plugin(self, plugin_file: str, context: Dict[str, Any]) -> None:
-        # Dynamically import plugin module from a file path
-        try:
-            module_name = f"plugin_{abs(hash(plugin_file))}"
-            spec = importlib.util.spec_from_file_location(module_name, plugin_file)
-            if spec is None or spec.loader is None:
+        # Reuse the already imported module while the plugin file is unchanged
+        cached = self._plugin_module_cache.get(plugin_file)
+        if cached is not None:
+            try:
+                mtime = os.stat(plugin_file).st_mtime
+            except Exception:
+                mtime = None
+            if mtime == cached[0]:
+                self._show_plugin_window(cached[1], context)
                 return
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)  # type: ignore[attr-defined]
-        except Exception:
-            return
+
+        # Import the plugin on a worker thread so heavy imports don't freeze the UI;
+        # the window itself is created in _on_plugin_loaded on the GUI thread
+        task = _PluginImportTask(plugin_file, context, self._plugin_signals)
+        QThreadPool.globalInstance().start(task)
+
+    def _close_plugin_progress(self) -> None:
+        progress = self._plugin_progress
+        self._plugin_progress = None
+        if progress is not None:
+            try:
+                progress.close()
+            except Exception:
+                pass
+
+    def _on_plugin_failed(self, context: Dict[str, Any]) -> None:
+        self._close_plugin_progress()
+
+    def _on_plugin_loaded(self, plugin_file: str, mtime: float, module: ModuleType, context: Dict[str, Any]) -> None:
+        self._plugin_module_cache[plugin_file] = (mtime, module)
+        self._show_plugin_window(module, context)
+
+    def _show_plugin_window(self, module: ModuleType, context: Dict[str, Any]) -> None:
+        self._close_plugin_progress()
 
         # Expect a factory function create_window(parent, context)
         create_fn = getattr(module, "create_window", None)
@@ -686,6 +1156,8 @@ def main() -> int:
         if candidate.lower().endswith(".json") and os.path.isfile(candidate):
             json_to_execute = candidate
 
+    # Lets QtWebEngineWidgets be imported after the QApplication exists
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     app_icon_path = _resolve_app_icon_path()
     if app_icon_path:
@@ -695,7 +1167,7 @@ def main() -> int:
     # If a JSON file was provided on CLI, execute its openaction right away
     if json_to_execute:
         descriptor = load_object_descriptor(json_to_execute)
-        if isinstance(descriptor, dict):
+        if descriptor is not None:
             try:
                 window.execute_openaction(descriptor, json_to_execute)
             except Exception: